@@ -13,15 +13,21 @@ __email__ = "evamaxfieldbrown@gmail.com"
 from .core import (
     GROBIDDeploymentConfig,
     GROBIDDeploymentConfigs,
+    GROBIDDeploymentSpec,
+    ServiceWaitStoppedError,
     deploy_and_wait_for_ready,
+    deploy_and_wait_for_ready_batch,
     terminate_instance,
 )
 
 __all__ = [
     "deploy_and_wait_for_ready",
+    "deploy_and_wait_for_ready_batch",
     "terminate_instance",
     "GROBIDDeploymentConfig",
     "GROBIDDeploymentConfigs",
+    "GROBIDDeploymentSpec",
+    "ServiceWaitStoppedError",
     "__version__",
     "__author__",
     "__email__",
@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
+import datetime
+import functools
 import json
 import logging
 import re
+import threading
 import time
-from dataclasses import dataclass
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import astuple, dataclass, field, replace
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import boto3
 import requests
+from botocore.config import Config
 from dotenv import load_dotenv
 from jinja2 import Template
 
@@ -27,12 +33,54 @@ DEFAULT_STARTUP_SCRIPT_TEMPLATE_PATH = STATIC_DIR / "startup-script.jinja"
 NVIDIA_DOCKER_INSTALLATION_PATH = STATIC_DIR / "nvidia-docker-install.sh"
 UBUNTU_AMI_DATA_PATH = STATIC_DIR / "ubuntu-amis.json"
 
+# Local cache files
+AMI_CACHE_DIR = Path.home() / ".aws_grobid" / "ami_cache"
+
 # Constants
 GPU_INSTANCE_TYPES = [
     "p",  # NVIDIA GPU families (P*)
     "g",  # NVIDIA GPU families (G*)
 ]
 
+# Instance type pattern, e.g. "m6a.4xlarge"
+INSTANCE_TYPE_PATTERN = re.compile(
+    r"^([a-zA-Z]+)([0-9]{1})([a-zA-Z\-]*)\.([a-zA-Z0-9]+)$"
+)
+
+# Index the AMI data once by (region, arch, gpu) for constant-time lookup
+with open(UBUNTU_AMI_DATA_PATH) as _ami_f:
+    _AMI_INDEX: dict[tuple[str, str, bool], str] = {
+        (ami_piece["region"], ami_piece["arch"], ami_piece["gpu"]): ami_piece["ami_id"]
+        for ami_piece in json.load(_ami_f)
+    }
+
+# Shared client config, retrying throttled calls from concurrent launches
+EC2_CLIENT_CONFIG = Config(
+    retries={"mode": "adaptive"},
+    max_pool_connections=32,
+)
+
+# EC2 resources per thread, keyed by (region, profile)
+_EC2_RESOURCES = threading.local()
+
+# Upper bound on concurrent service readiness checks in batched deployments
+MAX_CONCURRENT_READY_CHECKS = 32
+
+# Default VPC IDs resolved from EC2, keyed by client
+# (clients are cached per region and profile, i.e. per account)
+# Weakly keyed so that cache entries never keep a client alive
+_DEFAULT_VPC_ID_CACHE: weakref.WeakKeyDictionary[
+    EC2Client, str
+] = weakref.WeakKeyDictionary()
+
+# Security group IDs resolved from EC2, keyed by client then name
+_SECURITY_GROUP_ID_CACHE: weakref.WeakKeyDictionary[
+    EC2Client, dict[str, str]
+] = weakref.WeakKeyDictionary()
+
+# Snapshot IDs resolved from EC2, keyed by (region, ami_id)
+_SNAPSHOT_ID_CACHE: dict[tuple[str, str], str] = {}
+
 
 @dataclass
 class GROBIDDeploymentConfig:
@@ -74,6 +122,10 @@ class GROBIDDeploymentConfigs:
     software_mentions = SOFTWARE_MENTIONS_DEPLOYMENT_CONFIG
 
 
+class ServiceWaitStoppedError(Exception):
+    """Raised when waiting for a service is stopped before it became ready."""
+
+
 #######################################################################################
 
 log = logging.getLogger(__name__)
@@ -81,38 +133,116 @@ log = logging.getLogger(__name__)
 #######################################################################################
 
 
+def _create_session(region: str, profile_name: str | None) -> boto3.Session:
+    if profile_name:
+        return boto3.Session(profile_name=profile_name, region_name=region)
+    return boto3.Session(region_name=region)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_ec2_client(region: str, profile_name: str | None) -> EC2Client:
+    # Reuse clients per region and profile to skip reloading the service model
+    # Clients are thread-safe, so a single client is shared across launches
+    return _create_session(region=region, profile_name=profile_name).client(
+        "ec2", config=EC2_CLIENT_CONFIG
+    )
+
+
+def _get_ec2_resource(region: str, profile_name: str | None) -> EC2ServiceResource:
+    # Resources are not thread-safe, so each thread reuses its own
+    # per region and profile rather than sharing one across threads
+    resources = getattr(_EC2_RESOURCES, "resources", None)
+    if resources is None:
+        resources = {}
+        _EC2_RESOURCES.resources = resources
+
+    resource_key = (region, profile_name)
+    if resource_key not in resources:
+        resources[resource_key] = _create_session(
+            region=region,
+            profile_name=profile_name,
+        ).resource("ec2", config=EC2_CLIENT_CONFIG)
+
+    return resources[resource_key]
+
+
 def get_default_vpc_id(ec2_client: EC2Client) -> str:
     """Get the default VPC ID for the region."""
+    # The default VPC of an account and region is fixed for the lifetime of the process
+    if ec2_client in _DEFAULT_VPC_ID_CACHE:
+        return _DEFAULT_VPC_ID_CACHE[ec2_client]
+
     response = ec2_client.describe_vpcs(
         Filters=[{"Name": "isDefault", "Values": ["true"]}]
     )
     if not response["Vpcs"]:
         raise ValueError("No default VPC found in this region")
-    return response["Vpcs"][0]["VpcId"]  # Return the first default VPC ID (if any)
+    # Use the first default VPC ID (if any)
+    vpc_id = response["Vpcs"][0]["VpcId"]
+    _DEFAULT_VPC_ID_CACHE[ec2_client] = vpc_id
+    return vpc_id
 
 
-def create_security_group(
+def _create_vpc_security_group(
     ec2_client: EC2Client,
     name: str,
     description: str,
+    vpc_id: str,
 ) -> str:
-    """Create a security group in the specified VPC."""
     try:
         response = ec2_client.create_security_group(
             GroupName=name,
             Description=description,
-            VpcId=get_default_vpc_id(ec2_client),
+            VpcId=vpc_id,
         )
         return response["GroupId"]
     except ec2_client.exceptions.ClientError as e:
         if e.response["Error"]["Code"] == "InvalidGroup.Duplicate":
-            # Get the ID of the existing security group
-            response = ec2_client.describe_security_groups(GroupNames=[name])
-            return response["SecurityGroups"][0]["GroupId"]
+            # A concurrent launch created it in the meantime
+            existing = ec2_client.describe_security_groups(
+                Filters=[
+                    {"Name": "group-name", "Values": [name]},
+                    {"Name": "vpc-id", "Values": [vpc_id]},
+                ]
+            )
+            return existing["SecurityGroups"][0]["GroupId"]
         else:
             raise e
 
 
+def create_security_group(
+    ec2_client: EC2Client,
+    name: str,
+    description: str,
+) -> str:
+    """Create a security group in the specified VPC."""
+    security_group_ids = _SECURITY_GROUP_ID_CACHE.setdefault(ec2_client, {})
+    if name in security_group_ids:
+        return security_group_ids[name]
+
+    # Reuse the security group if it already exists in the default VPC
+    # (which is where instances are launched)
+    vpc_id = get_default_vpc_id(ec2_client)
+    security_groups = ec2_client.describe_security_groups(
+        Filters=[
+            {"Name": "group-name", "Values": [name]},
+            {"Name": "vpc-id", "Values": [vpc_id]},
+        ]
+    )["SecurityGroups"]
+    if security_groups:
+        security_group_id = security_groups[0]["GroupId"]
+    else:
+        security_group_id = _create_vpc_security_group(
+            ec2_client,
+            name=name,
+            description=description,
+            vpc_id=vpc_id,
+        )
+
+    security_group_ids[name] = security_group_id
+    return security_group_id
+
+
 def add_security_group_rules(
     ec2_client: EC2Client,
     security_group_id: str,
@@ -149,15 +279,111 @@ def add_security_group_rules(
             raise e
 
 
+def _get_image_cache_week_suffix() -> str:
+    # Cache files roll over weekly so that any AMI changes are picked up
+    year, week, _ = datetime.date.today().isocalendar()
+    return f"{year}_w{week}"
+
+
+def _get_image_cache_path(region: str, vm_image_id: str) -> Path:
+    suffix = _get_image_cache_week_suffix()
+    return AMI_CACHE_DIR / f"aws_ami_{region}_{vm_image_id}_{suffix}.json"
+
+
+def _get_image_snapshot_id(image: dict) -> str:
+    return image["BlockDeviceMappings"][0]["Ebs"]["SnapshotId"]
+
+
+def _read_cached_image(cache_path: Path) -> dict | None:
+    try:
+        image = json.loads(cache_path.read_text())
+        # Treat partial or malformed payloads as a miss
+        if not isinstance(_get_image_snapshot_id(image), str):
+            return None
+        return image
+    except (OSError, ValueError, KeyError, IndexError, TypeError):
+        return None
+
+
+def _write_cached_image(cache_path: Path, image: dict) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(image))
+
+        # Remove cache files from previous weeks
+        current_suffix = f"_{_get_image_cache_week_suffix()}.json"
+        for stale_path in cache_path.parent.glob("aws_ami_*.json"):
+            if not stale_path.name.endswith(current_suffix):
+                stale_path.unlink(missing_ok=True)
+    except OSError as e:
+        log.debug(f"Unable to write AMI cache file {cache_path}: {e}")
+
+
 def get_image_default_snapshot_id(
     ec2_client: EC2Client,
     vm_image_id: str,
 ) -> str:
     """Get the default snapshot ID for the specified base image."""
-    response = ec2_client.describe_images(ImageIds=[vm_image_id])
-    if not response["Images"]:
-        raise ValueError(f"No image found with ID {vm_image_id}")
-    return response["Images"][0]["BlockDeviceMappings"][0]["Ebs"]["SnapshotId"]
+    # AMI IDs are region scoped and their snapshots never change,
+    # so only describe each image once per process
+    region = ec2_client.meta.region_name
+    cache_key = (region, vm_image_id)
+    if cache_key in _SNAPSHOT_ID_CACHE:
+        return _SNAPSHOT_ID_CACHE[cache_key]
+
+    # Fall back to this week's on-disk cache before asking EC2
+    cache_path = _get_image_cache_path(region=region, vm_image_id=vm_image_id)
+    image = _read_cached_image(cache_path)
+    if image is None:
+        response = ec2_client.describe_images(ImageIds=[vm_image_id])
+        if not response["Images"]:
+            raise ValueError(f"No image found with ID {vm_image_id}")
+        image = {
+            "ImageId": response["Images"][0]["ImageId"],
+            "BlockDeviceMappings": response["Images"][0]["BlockDeviceMappings"],
+        }
+        _write_cached_image(cache_path, image)
+
+    snapshot_id = _get_image_snapshot_id(image)
+    _SNAPSHOT_ID_CACHE[cache_key] = snapshot_id
+    return snapshot_id
+
+
+def _get_template_mtime_ns(path: str) -> int:
+    return Path(path).stat().st_mtime_ns
+
+
+@functools.lru_cache(maxsize=8)
+def _load_template(path: str, mtime_ns: int) -> Template:
+    # Compile the template once per path and reuse across launches
+    # mtime_ns is only part of the cache key so that template edits are picked up
+    return Template(Path(path).read_text())
+
+
+@functools.lru_cache(maxsize=16)
+def _render_startup_script(
+    template_path: str,
+    docker_image: str,
+    api_port: int,
+    is_nvidia_gpu_instance: bool,
+    mtime_ns: int,
+) -> str:
+    # Launches with the same settings reuse the rendered script verbatim
+    if is_nvidia_gpu_instance:
+        # Need to install nvidia-docker on the instance
+        with open(NVIDIA_DOCKER_INSTALLATION_PATH) as open_f:
+            nvidia_docker_installation = open_f.read()
+        gpu_attach = "--gpus all --init --ulimit core=0"
+    else:
+        nvidia_docker_installation = ""
+        gpu_attach = ""
+
+    return _load_template(template_path, mtime_ns).render(
+        docker_image=docker_image,
+        api_port=api_port,
+        gpu_attach=gpu_attach,
+        nvidia_docker_install=nvidia_docker_installation,
+    )
 
 
 @dataclass
@@ -172,10 +398,7 @@ def _parse_instance_type(instance_type: str) -> InstanceTypeDetails:
     # primary type (e.g. "M5")
     # attachments (e.g. "a", "g")
     # and size (e.g. "2xlarge")
-    match = re.match(
-        r"^([a-zA-Z]+)([0-9]{1})([a-zA-Z\-]*)\.([a-zA-Z0-9]+)$",
-        instance_type,
-    )
+    match = INSTANCE_TYPE_PATTERN.match(instance_type)
 
     # Primary type is groups 1 and 2
     # Attachments is group 3
@@ -191,7 +414,78 @@ def _parse_instance_type(instance_type: str) -> InstanceTypeDetails:
     raise ValueError(f"Instance type {instance_type} does not match expected format")
 
 
-def launch_instance(
+def _is_nvidia_gpu_instance(instance_type_details: InstanceTypeDetails) -> bool:
+    primary = instance_type_details.primary_type.lower()
+    return primary.startswith("g") or primary.startswith("p")
+
+
+def _lookup_ami(region: str, instance_type: str) -> str:
+    instance_type_details = _parse_instance_type(instance_type)
+    is_nvidia_gpu_instance = _is_nvidia_gpu_instance(instance_type_details)
+
+    # Determine if we are looking for arm64 or x86_64/amd64 architecture
+    # based on the instance type attachments ("g" suffix indicates Graviton/ARM)
+    # "a1" is the one Graviton family without the "g" suffix
+    if (
+        "g" in instance_type_details.attachments
+        or instance_type_details.primary_type.lower() == "a1"
+    ):
+        selected_arch = "arm64"
+    else:
+        selected_arch = "amd64"
+
+    # Lookup image id for the specified region and architecture and gpu
+    vm_image_id = _AMI_INDEX.get((region, selected_arch, is_nvidia_gpu_instance))
+
+    # Handle not found
+    if vm_image_id is None:
+        raise ValueError(
+            f"No AMI found for region {region}, "
+            f"architecture {selected_arch}, "
+            f"and GPU {is_nvidia_gpu_instance} combination"
+        )
+
+    return vm_image_id
+
+
+def _setup_security_group(
+    ec2_client: EC2Client,
+    name: str,
+    description: str,
+    api_port: int,
+) -> str:
+    # Create security group
+    log.info(f"🛡️  Creating security group: {name}")
+    security_group_id = create_security_group(
+        ec2_client=ec2_client,
+        name=name,
+        description=description,
+    )
+    log.info(f"   Security group created with ID: {security_group_id}")
+
+    # Authorize security group ingress rules
+    log.info(f"🔐 Configuring security group rules for ports 22, 443, and {api_port}")
+    add_security_group_rules(
+        ec2_client=ec2_client,
+        security_group_id=security_group_id,
+        api_port=api_port,
+    )
+
+    return security_group_id
+
+
+def _prefetch_image_snapshot_id(
+    ec2_client: EC2Client,
+    region: str,
+    instance_type: str,
+) -> str:
+    return get_image_default_snapshot_id(
+        ec2_client,
+        vm_image_id=_lookup_ami(region=region, instance_type=instance_type),
+    )
+
+
+def launch_instances(
     ec2_client: EC2Client,
     ec2_resource: EC2ServiceResource,
     region: str,
@@ -203,20 +497,16 @@ def launch_instance(
     api_port: int,
     startup_script_template_path: str,
     tags: list[str] | dict[str, str] | None = None,
-) -> EC2Instance:
-    """Launch an EC2 instance with the specified settings."""
+    count: int = 1,
+) -> list[EC2Instance]:
+    """Launch `count` identical EC2 instances with a single RunInstances call."""
     # Parse instance type
     instance_type_details = _parse_instance_type(instance_type)
 
     # Determine if NVIDIA GPU instance requested from primary family
-    primary = instance_type_details.primary_type.lower()
-    is_nvidia_gpu_instance = primary.startswith("g") or primary.startswith("p")
+    is_nvidia_gpu_instance = _is_nvidia_gpu_instance(instance_type_details)
     if is_nvidia_gpu_instance:
         log.debug(f"Detected NVIDIA GPU instance type: {instance_type}")
-        # Need to install nvidia-docker on the instance
-        with open(NVIDIA_DOCKER_INSTALLATION_PATH) as open_f:
-            nvidia_docker_installation = open_f.read()
-        gpu_attach = "--gpus all --init --ulimit core=0"
 
         # Handle larger storage requirement
         if storage_size < 75:
@@ -228,51 +518,18 @@ def launch_instance(
 
     else:
         log.debug(f"Detected non-NVIDIA-GPU instance type: {instance_type}")
-        nvidia_docker_installation = ""
-        gpu_attach = ""
 
-    # Load the startup script template
-    with open(startup_script_template_path) as f:
-        startup_script_template = Template(f.read())
-
-    # Render the startup script with the specified Docker image
-    startup_script = startup_script_template.render(
+    # Render the (cached) startup script with the specified Docker image
+    startup_script = _render_startup_script(
+        template_path=startup_script_template_path,
         docker_image=docker_image,
         api_port=api_port,
-        gpu_attach=gpu_attach,
-        nvidia_docker_install=nvidia_docker_installation,
+        is_nvidia_gpu_instance=is_nvidia_gpu_instance,
+        mtime_ns=_get_template_mtime_ns(startup_script_template_path),
     )
 
-    # Load the AMI data from the JSON file
-    with open(UBUNTU_AMI_DATA_PATH) as f:
-        ami_data = json.load(f)
-
-    # Determine if we are looking for arm64 or x86_64/amd64 architecture
-    # based on the instance type attachments ("g" suffix indicates Graviton/ARM)
-    if "g" in instance_type_details.attachments:
-        selected_arch = "arm64"
-    else:
-        selected_arch = "amd64"
-
-    # Iter over ami data to find image id
-    # for the specified region and architecture and gpu
-    vm_image_id = ""
-    for ami_piece in ami_data:
-        if (
-            ami_piece["region"] == region
-            and ami_piece["arch"] == selected_arch
-            and ami_piece["gpu"] == is_nvidia_gpu_instance
-        ):
-            vm_image_id = ami_piece["ami_id"]
-            break
-
-    # Handle not found
-    if len(vm_image_id) == 0:
-        raise ValueError(
-            f"No AMI found for region {region}, "
-            f"architecture {selected_arch}, "
-            f"and GPU {is_nvidia_gpu_instance} combination"
-        )
+    # Lookup image id for the specified region, architecture, and gpu
+    vm_image_id = _lookup_ami(region=region, instance_type=instance_type)
 
     # Parse tags
     if tags is None:
@@ -337,20 +594,51 @@ def launch_instance(
             "EnableResourceNameDnsARecord": True,
             "EnableResourceNameDnsAAAARecord": False,
         },
-        MinCount=1,
-        MaxCount=1,
+        MinCount=count,
+        MaxCount=count,
         UserData=startup_script,
     )
 
-    return instances[0]
+    return instances
+
+
+def launch_instance(
+    ec2_client: EC2Client,
+    ec2_resource: EC2ServiceResource,
+    region: str,
+    security_group_id: str,
+    instance_type: str,
+    instance_name: str,
+    storage_size: int,
+    docker_image: str,
+    api_port: int,
+    startup_script_template_path: str,
+    tags: list[str] | dict[str, str] | None = None,
+) -> EC2Instance:
+    """Launch an EC2 instance with the specified settings."""
+    return launch_instances(
+        ec2_client=ec2_client,
+        ec2_resource=ec2_resource,
+        region=region,
+        security_group_id=security_group_id,
+        instance_type=instance_type,
+        instance_name=instance_name,
+        storage_size=storage_size,
+        docker_image=docker_image,
+        api_port=api_port,
+        startup_script_template_path=startup_script_template_path,
+        tags=tags,
+        count=1,
+    )[0]
 
 
 #######################################################################################
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EC2InstanceDetails:
-    instance: EC2Instance
+    # Live boto3 resource, typed loosely as the stubs are not a runtime dependency
+    instance: Any = field(repr=False, compare=False)
     region: str
     instance_id: str
     instance_type: str
@@ -359,7 +647,56 @@ class EC2InstanceDetails:
     api_url: str
 
 
-def launch_grobid_api_instance(
+def _wait_for_launched_instances(
+    ec2_client: EC2Client,
+    region: str,
+    instances: list[EC2Instance],
+    api_port: int,
+) -> list[EC2InstanceDetails]:
+    instance_ids = [instance.id for instance in instances]
+    for instance_id in instance_ids:
+        log.info(f"   Instance launch initiated: {instance_id}")
+    log.info("⏳ Waiting for instance(s) to enter 'running' state...")
+
+    # Wait for all of the instances to be running
+    ec2_client.get_waiter("instance_running").wait(InstanceIds=instance_ids)
+
+    # Fetch the instance attributes for all of the instances at once
+    response = ec2_client.describe_instances(InstanceIds=instance_ids)
+    descriptions = {
+        description["InstanceId"]: description
+        for reservation in response["Reservations"]
+        for description in reservation["Instances"]
+    }
+
+    instance_details = []
+    for instance in instances:
+        description = descriptions[instance.id]
+        public_ip = description.get("PublicIpAddress", "")
+        public_dns = description.get("PublicDnsName", "")
+
+        # Log the instance details
+        log.info(f"✅ Instance {instance.id} is now running")
+        log.info(f"   Public IP: {public_ip}")
+        log.info(f"   Public DNS: {public_dns}")
+        log.info(f"   API URL: http://{public_ip}:{api_port}")
+
+        instance_details.append(
+            EC2InstanceDetails(
+                instance=instance,
+                region=region,
+                instance_id=instance.id,
+                instance_type=description["InstanceType"],
+                public_ip=public_ip,
+                public_dns=public_dns,
+                api_url=f"http://{public_ip}:{api_port}",
+            )
+        )
+
+    return instance_details
+
+
+def launch_grobid_api_instances(
     region: str = "us-west-2",
     instance_type: str = "m6a.4xlarge",
     storage_size: int = 28,
@@ -373,45 +710,50 @@ def launch_grobid_api_instance(
     ),
     startup_script_template_path: str = str(DEFAULT_STARTUP_SCRIPT_TEMPLATE_PATH),
     profile_name: str | None = None,
-) -> EC2InstanceDetails:
-    """Launch a GROBID Software Mentions API EC2 instance."""
+    count: int = 1,
+) -> list[EC2InstanceDetails]:
+    """Launch `count` identical GROBID API EC2 instances."""
     # Always load the environment variables from the .env file
     # as they may contain AWS credentials
     load_dotenv()
 
     log.info(f"🔧 Setting up AWS session for region {region}")
-    # Create boto3 clients and resources
     if profile_name:
-        session = boto3.Session(profile_name=profile_name, region_name=region)
         log.info(f"   Using AWS profile: {profile_name}")
-    else:
-        session = boto3.Session(region_name=region)
-
-    ec2_client = session.client("ec2")
-    ec2_resource = session.resource("ec2")
-
-    # Create security group
-    log.info(f"🛡️  Creating security group: {security_group_name}")
-    security_group_id = create_security_group(
-        ec2_client=ec2_client,
-        name=security_group_name,
-        description=security_group_description,
-    )
-    log.info(f"   Security group created with ID: {security_group_id}")
-
-    # Authorize security group ingress rules
-    log.info(f"🔐 Configuring security group rules for ports 22, 443, and {api_port}")
-    add_security_group_rules(
-        ec2_client=ec2_client,
-        security_group_id=security_group_id,
-        api_port=api_port,
-    )
+    ec2_client = _get_ec2_client(region=region, profile_name=profile_name)
+    ec2_resource = _get_ec2_resource(region=region, profile_name=profile_name)
+
+    # The security group setup, AMI snapshot lookup, and template compilation
+    # are independent of each other, so run them concurrently. Results are
+    # cached and picked back up by launch_instances.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        security_group_future = executor.submit(
+            _setup_security_group,
+            ec2_client=ec2_client,
+            name=security_group_name,
+            description=security_group_description,
+            api_port=api_port,
+        )
+        snapshot_future = executor.submit(
+            _prefetch_image_snapshot_id,
+            ec2_client=ec2_client,
+            region=region,
+            instance_type=instance_type,
+        )
+        template_future = executor.submit(
+            _load_template,
+            startup_script_template_path,
+            _get_template_mtime_ns(startup_script_template_path),
+        )
+        security_group_id = security_group_future.result()
+        snapshot_future.result()
+        template_future.result()
 
-    # Launch EC2 instance
-    log.info(f"🚀 Launching EC2 instance {instance_name} ({instance_type})")
+    # Launch EC2 instances
+    log.info(f"🚀 Launching {count} EC2 instance(s) {instance_name} ({instance_type})")
     log.info(f"   Docker image: {docker_image}")
     log.info(f"   Storage size: {storage_size} GiB")
-    instance = launch_instance(
+    instances = launch_instances(
         ec2_client=ec2_client,
         ec2_resource=ec2_resource,
         region=region,
@@ -423,31 +765,57 @@ def launch_grobid_api_instance(
         api_port=api_port,
         startup_script_template_path=startup_script_template_path,
         tags=tags,
+        count=count,
     )
-    log.info(f"   Instance launch initiated: {instance.id}")
-    log.info("⏳ Waiting for instance to enter 'running' state...")
 
-    # Wait for the instance to be running
-    instance.wait_until_running()
+    try:
+        instance_details = _wait_for_launched_instances(
+            ec2_client=ec2_client,
+            region=region,
+            instances=instances,
+            api_port=api_port,
+        )
+    except Exception as e:
+        # Don't leak launched instances that never became usable
+        instance_ids = [instance.id for instance in instances]
+        log.error(f"❌ Instance(s) failed to start: {e}")
+        log.error(f"🧹 Cleaning up: terminating instance(s) {instance_ids}")
+        ec2_client.terminate_instances(InstanceIds=instance_ids)
+        raise e
 
-    # Reload the instance attributes
-    instance.load()
+    return instance_details
 
-    # Log the instance details
-    log.info(f"✅ Instance {instance.id} is now running")
-    log.info(f"   Public IP: {instance.public_ip_address}")
-    log.info(f"   Public DNS: {instance.public_dns_name}")
-    log.info(f"   API URL: http://{instance.public_ip_address}:{api_port}")
 
-    return EC2InstanceDetails(
-        instance=instance,
+def launch_grobid_api_instance(
+    region: str = "us-west-2",
+    instance_type: str = "m6a.4xlarge",
+    storage_size: int = 28,
+    tags: list[str] | dict[str, str] | None = None,
+    instance_name: str = "grobid-software-mentions-api-server",
+    docker_image: str = "lfoppiano/software-mentions:0.8.2",
+    api_port: int = 8060,
+    security_group_name: str = "grobid-software-mentions-api-server-sg",
+    security_group_description: str = (
+        "Security group for GROBID Software Mentions API server"
+    ),
+    startup_script_template_path: str = str(DEFAULT_STARTUP_SCRIPT_TEMPLATE_PATH),
+    profile_name: str | None = None,
+) -> EC2InstanceDetails:
+    """Launch a GROBID Software Mentions API EC2 instance."""
+    return launch_grobid_api_instances(
         region=region,
-        instance_id=instance.id,
-        instance_type=instance.instance_type,
-        public_ip=instance.public_ip_address,
-        public_dns=instance.public_dns_name,
-        api_url=f"http://{instance.public_ip_address}:{api_port}",
-    )
+        instance_type=instance_type,
+        storage_size=storage_size,
+        tags=tags,
+        instance_name=instance_name,
+        docker_image=docker_image,
+        api_port=api_port,
+        security_group_name=security_group_name,
+        security_group_description=security_group_description,
+        startup_script_template_path=startup_script_template_path,
+        profile_name=profile_name,
+        count=1,
+    )[0]
 
 
 def terminate_instance(
@@ -462,12 +830,8 @@ def terminate_instance(
 
     log.info(f"🔧 Setting up AWS session for region {region}")
     if profile_name:
-        session = boto3.Session(profile_name=profile_name, region_name=region)
         log.info(f"   Using AWS profile: {profile_name}")
-    else:
-        session = boto3.Session(region_name=region)
-
-    ec2_client = session.client("ec2")
+    ec2_client = _get_ec2_client(region=region, profile_name=profile_name)
     log.info(f"🛑 Terminating instance {instance_id}...")
     ec2_client.terminate_instances(InstanceIds=[instance_id])
     log.info(f"✅ Instance {instance_id} termination initiated")
@@ -478,8 +842,17 @@ def wait_for_service_ready(
     api_url: str,
     timeout: int = 420,  # 7 minutes
     interval: int = 10,
+    stop_event: threading.Event | None = None,
 ) -> None:
-    """Wait for the GROBID API service to be ready."""
+    """
+    Wait for the GROBID API service to be ready.
+
+    Raises `TimeoutError` if the service is not ready within `timeout` seconds
+    and `ServiceWaitStoppedError` if `stop_event` is set before then.
+    """
+    if stop_event is None:
+        stop_event = threading.Event()
+
     # Determine API isalive URL by docker image name
     if "software-mentions" in docker_image:
         alive_url = f"{api_url}/service/isalive"
@@ -492,7 +865,7 @@ def wait_for_service_ready(
 
     start_time = time.time()
     attempts = 0
-    while True:
+    while not stop_event.is_set():
         attempts += 1
         try:
             response = requests.get(alive_url, timeout=5)
@@ -512,7 +885,10 @@ def wait_for_service_ready(
         if time.time() - start_time > timeout:
             raise TimeoutError(f"Service did not become ready within {timeout} seconds")
 
-        time.sleep(interval)
+        stop_event.wait(interval)
+
+    log.info(f"   Stopped waiting for service at {api_url}")
+    raise ServiceWaitStoppedError(f"Stopped waiting for service at {api_url}")
 
 
 #######################################################################################
@@ -602,3 +978,180 @@ def deploy_and_wait_for_ready(
         f"🎉 GROBID API is fully ready and accessible at {instance_details.api_url}"
     )
     return instance_details
+
+
+@dataclass
+class GROBIDDeploymentSpec:
+    grobid_config: GROBIDDeploymentConfig = field(
+        default_factory=lambda: replace(GROBIDDeploymentConfigs.grobid_crf)
+    )
+    instance_type: str = "m6a.4xlarge"
+    storage_size: int = 28
+    region: str = "us-west-2"
+    tags: list[str] | dict[str, str] | None = None
+
+
+def _deployment_spec_batch_key(spec: GROBIDDeploymentSpec) -> tuple:
+    # Specs sharing a key produce identical RunInstances requests
+    if isinstance(spec.tags, dict):
+        tags_key = tuple(sorted(f"{k}={v}" for k, v in spec.tags.items()))
+    else:
+        tags_key = tuple(sorted(spec.tags or []))
+
+    return (
+        spec.region,
+        spec.instance_type,
+        spec.storage_size,
+        astuple(spec.grobid_config),
+        tags_key,
+    )
+
+
+def _launch_deployment_spec(
+    spec: GROBIDDeploymentSpec,
+    count: int,
+    startup_script_template_path: str,
+    profile_name: str | None,
+) -> list[EC2InstanceDetails]:
+    return launch_grobid_api_instances(
+        region=spec.region,
+        instance_type=spec.instance_type,
+        storage_size=spec.storage_size,
+        tags=spec.tags,
+        instance_name=spec.grobid_config.instance_name,
+        docker_image=spec.grobid_config.docker_image,
+        api_port=spec.grobid_config.api_port,
+        security_group_name=spec.grobid_config.security_group_name,
+        security_group_description=spec.grobid_config.security_group_description,
+        startup_script_template_path=startup_script_template_path,
+        profile_name=profile_name,
+        count=count,
+    )
+
+
+def _collect_batch_launches(
+    launch_futures: dict[Future[list[EC2InstanceDetails]], list[int]],
+    results: list[EC2InstanceDetails | None],
+) -> None:
+    # Gather every successful launch before raising
+    # so that all launched instances can be cleaned up
+    launch_error: Exception | None = None
+    for launch_future, indices in launch_futures.items():
+        try:
+            for index, instance_details in zip(
+                indices, launch_future.result(), strict=True
+            ):
+                results[index] = instance_details
+        except Exception as e:
+            launch_error = e
+
+    if launch_error is not None:
+        raise launch_error
+
+
+def deploy_and_wait_for_ready_batch(
+    specs: list[GROBIDDeploymentSpec],
+    startup_script_template_path: str = str(DEFAULT_STARTUP_SCRIPT_TEMPLATE_PATH),
+    timeout: int = 420,  # 7 minutes
+    interval: int = 10,  # seconds
+    profile_name: str | None = None,
+) -> list[EC2InstanceDetails]:
+    """
+    Deploy multiple GROBID servers and wait for all of them to be ready.
+
+    Specs with identical settings are launched together with a single
+    RunInstances call. If any server fails to become ready, all deployed
+    instances are terminated.
+
+    Parameters
+    ----------
+    specs : list[GROBIDDeploymentSpec]
+        The deployments to make, one instance per spec.
+    startup_script_template_path : str
+        Path to the Jinja2 template file for the startup script.
+    timeout : int
+        The maximum time to wait for each service to be ready. Default: 7 minutes.
+    interval : int
+        The time to wait between checks for a service being ready.
+    profile_name : str | None
+        The AWS profile name to use for authentication.
+
+    Returns
+    -------
+    list[EC2InstanceDetails]
+        The deployed instances, in the same order as `specs`.
+    """
+    log.info(f"🎯 Starting batched GROBID deployment of {len(specs)} server(s)...")
+    if len(specs) == 0:
+        return []
+
+    # Group spec indices by identical launch settings
+    batches: dict[tuple, list[int]] = {}
+    for index, spec in enumerate(specs):
+        batches.setdefault(_deployment_spec_batch_key(spec), []).append(index)
+
+    results: list[EC2InstanceDetails | None] = [None] * len(specs)
+    try:
+        with ThreadPoolExecutor(max_workers=len(batches)) as launch_executor:
+            # Deploy each batch with a single launch
+            launch_futures = {
+                launch_executor.submit(
+                    _launch_deployment_spec,
+                    spec=specs[indices[0]],
+                    count=len(indices),
+                    startup_script_template_path=startup_script_template_path,
+                    profile_name=profile_name,
+                ): indices
+                for indices in batches.values()
+            }
+            _collect_batch_launches(launch_futures=launch_futures, results=results)
+
+        log.info(
+            "🐳 Instances are running, now waiting for Docker containers "
+            "to start and services to be ready..."
+        )
+
+        # Wait for all of the services to be ready, one check per instance,
+        # stopping the remaining checks as soon as any of them fails
+        stop_event = threading.Event()
+        with ThreadPoolExecutor(
+            max_workers=min(len(specs), MAX_CONCURRENT_READY_CHECKS)
+        ) as ready_executor:
+            ready_futures = [
+                ready_executor.submit(
+                    wait_for_service_ready,
+                    docker_image=spec.grobid_config.docker_image,
+                    api_url=instance_details.api_url,
+                    timeout=timeout,
+                    interval=interval,
+                    stop_event=stop_event,
+                )
+                for spec, instance_details in zip(specs, results, strict=True)
+                if instance_details is not None
+            ]
+            try:
+                for ready_future in as_completed(ready_futures):
+                    ready_future.result()
+            finally:
+                stop_event.set()
+
+    except Exception as e:
+        log.error(f"❌ Batched deployment failed: {e}")
+        for instance_details in results:
+            if instance_details is None:
+                continue
+            log.error(
+                f"🧹 Cleaning up: terminating instance {instance_details.instance_id}",
+            )
+            terminate_instance(
+                region=instance_details.region,
+                instance_id=instance_details.instance_id,
+                profile_name=profile_name,
+            )
+        raise e
+
+    # All clear!
+    log.info(f"🎉 All {len(specs)} GROBID APIs are fully ready and accessible")
+    return [
+        instance_details for instance_details in results if instance_details is not None
+    ]